@@ -0,0 +1,188 @@
+import pygame
+import pytest
+
+
+def _grow(snake, length):
+    """Вытянуть змейку в линию заданной длины (движется вправо)."""
+    snake.length = length
+    for _ in range(length - 1):
+        snake.move()
+
+
+def test_move_keeps_body_set_in_sync(snake):
+    _grow(snake, 4)
+    for _ in range(10):
+        snake.move()
+    assert snake.body_set == set(snake.positions), (
+        'Множество `body_set` должно совпадать с клетками `positions`.'
+    )
+    assert len(snake.positions) == 4
+
+
+def test_move_detects_self_collision(snake, _the_snake):
+    _grow(snake, 5)
+    for direction in (_the_snake.DOWN, _the_snake.LEFT):
+        snake.direction = direction
+        snake.move()
+        assert not snake.collided
+    snake.direction = _the_snake.UP
+    snake.move()
+    assert snake.collided, (
+        'Змейка длины 5, сделавшая круг, должна врезаться в себя.'
+    )
+
+
+def test_move_into_vacated_tail_is_not_collision(snake, _the_snake):
+    _grow(snake, 4)
+    for direction in (_the_snake.DOWN, _the_snake.LEFT, _the_snake.UP):
+        snake.direction = direction
+        snake.move()
+    assert not snake.collided, (
+        'Клетка, которую только что освободил хвост, свободна.'
+    )
+
+
+def test_wrap_tables_match_modulo(snake, _the_snake):
+    directions = (
+        _the_snake.UP, _the_snake.DOWN, _the_snake.LEFT, _the_snake.RIGHT,
+    )
+    for cell in _the_snake.ALL_CELLS:
+        for dx, dy in directions:
+            snake.reset()
+            snake.positions[0] = cell
+            snake.direction = (dx, dy)
+            snake.move()
+            expected = (
+                (cell[0] + dx) % _the_snake.GRID_WIDTH,
+                (cell[1] + dy) % _the_snake.GRID_HEIGHT,
+            )
+            assert snake.get_head_position() == expected, (
+                f'Шаг {(dx, dy)} из клетки {cell} должен привести '
+                f'в {expected}.'
+            )
+
+
+@pytest.mark.parametrize('share', (0.3, 0.9))
+def test_apple_avoids_occupied_cells(apple, _the_snake, share):
+    cells = _the_snake.ALL_CELLS
+    occupied = set(cells[:int(len(cells) * share)])
+    for _ in range(200):
+        assert apple.randomize_position(occupied)
+        assert apple.position not in occupied, (
+            'Яблоко не должно появляться на змейке.'
+        )
+
+
+def test_apple_on_full_board(apple, _the_snake):
+    position = apple.position
+    assert apple.randomize_position(set(_the_snake.ALL_CELLS)) is False
+    assert apple.position == position
+
+
+def test_queue_direction_rules(snake, _the_snake):
+    snake.queue_direction(_the_snake.DOWN)
+    snake.queue_direction(_the_snake.DOWN)
+    snake.queue_direction(_the_snake.LEFT)
+    snake.queue_direction(_the_snake.UP)
+    assert list(snake.input_queue) == [_the_snake.DOWN, _the_snake.LEFT], (
+        'Повторы и нажатия сверх размера очереди должны отбрасываться, '
+        'не вытесняя уже выбранные повороты.'
+    )
+
+
+@pytest.mark.parametrize(
+    'presses',
+    (('LEFT', 'UP', 'LEFT'), ('RIGHT', 'DOWN', 'LEFT')),
+    ids=('reverse-up-left', 'repeat-down-left'),
+)
+def test_queue_keeps_turns_after_useless_press(snake, _the_snake, presses):
+    for name in presses:
+        snake.queue_direction(getattr(_the_snake, name))
+    for _ in range(len(snake.input_queue)):
+        snake.update_direction()
+    assert snake.direction == _the_snake.LEFT, (
+        'Разворот или повтор текущего направления не должен занимать '
+        'место в очереди и вытеснять следующий поворот.'
+    )
+
+
+def test_update_direction_applies_turns_one_per_step(snake, _the_snake):
+    snake.queue_direction(_the_snake.DOWN)
+    snake.queue_direction(_the_snake.LEFT)
+    snake.update_direction()
+    assert snake.direction == _the_snake.DOWN
+    snake.update_direction()
+    assert snake.direction == _the_snake.LEFT
+
+
+def test_update_direction_skips_reversal(snake, _the_snake):
+    snake.queue_direction(_the_snake.LEFT)
+    snake.queue_direction(_the_snake.UP)
+    snake.update_direction()
+    assert snake.direction == _the_snake.UP, (
+        'Разворот на 180 градусов должен пропускаться.'
+    )
+    assert not snake.input_queue
+
+
+def test_step_headless_eats_apple(snake, apple, _the_snake):
+    head_x, head_y = snake.get_head_position()
+    apple.position = ((head_x + 1) % _the_snake.GRID_WIDTH, head_y)
+    _the_snake.step_headless(snake, apple)
+    assert snake.length == 2
+    assert apple.position not in snake.body_set
+
+
+def test_step_headless_resets_on_collision(snake, apple, _the_snake):
+    _grow(snake, 5)
+    apple.position = (0, 0)
+    for direction in (_the_snake.DOWN, _the_snake.LEFT, _the_snake.UP):
+        snake.queue_direction(direction)
+        _the_snake.step_headless(snake, apple)
+    assert snake.length == 1
+    assert len(snake.positions) == 1
+    assert not snake.collided
+
+
+def test_draw_reports_every_cell_of_multi_step_frame(snake, _the_snake):
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (_the_snake.SCREEN_WIDTH, _the_snake.SCREEN_HEIGHT)
+    )
+    background = pygame.Surface(screen.get_size())
+    snake.length = 3
+    snake.draw(screen, background)
+
+    dirty_rects = []
+    for _ in range(3):
+        snake.move()
+        dirty_rects.extend(snake.draw(screen, background))
+
+    head_x, head_y = snake.get_head_position()
+    size = _the_snake.GRID_SIZE
+    heads = {
+        ((head_x - shift) * size, head_y * size) for shift in range(3)
+    }
+    assert heads <= {rect.topleft for rect in dirty_rects}, (
+        'Все клетки, изменившиеся за несколько шагов одного кадра, '
+        'должны попасть в список для display.update().'
+    )
+
+
+def test_apple_redrawn_only_after_move(apple, _the_snake):
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (_the_snake.SCREEN_WIDTH, _the_snake.SCREEN_HEIGHT)
+    )
+    assert apple.needs_redraw, 'Новое яблоко нужно нарисовать.'
+    apple.draw(screen)
+    assert not apple.needs_redraw, (
+        'Неподвижное яблоко не нужно перерисовывать каждый кадр.'
+    )
+    occupied = set(_the_snake.ALL_CELLS) - {apple.position}
+    assert apple.randomize_position(occupied)
+    assert not apple.needs_redraw, (
+        'Яблоко осталось в той же клетке — перерисовывать нечего.'
+    )
+    apple.randomize_position({apple.position})
+    assert apple.needs_redraw, 'Переместившееся яблоко нужно нарисовать.'
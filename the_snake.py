@@ -14,8 +14,9 @@
 from __future__ import annotations
 
 import pygame
-from random import randint
-from typing import List, Tuple, Optional
+from collections import deque
+from random import choice
+from typing import Deque, List, Optional, Set, Tuple
 
 
 # ------------------------
@@ -29,21 +30,66 @@ GRID_SIZE = 20  # одна клетка сетки = 20x20 пикселей
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE    # 32 клетки по горизонтали
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE  # 24 клетки по вертикали
 
+# Все клетки поля (в клетках сетки), по строкам сверху вниз.
+# Клетка (x, y) лежит по индексу y * GRID_WIDTH + x. Змейка и яблоко
+# ссылаются на эти же кортежи, поэтому шаг змейки не создаёт новых
+# объектов, а сегмент тела стоит лишь одну ссылку в очереди.
+ALL_CELLS = tuple(
+    (grid_x, grid_y)
+    for grid_y in range(GRID_HEIGHT)
+    for grid_x in range(GRID_WIDTH)
+)
+
+# Таблицы «телепорта через край» для шага на одну клетку.
+# _WRAP_X[x + 1] — столбец x после переноса (x от -1 до GRID_WIDTH),
+# _WRAP_Y[y + 1] — начало строки y в ALL_CELLS после переноса.
+_WRAP_X = tuple(i % GRID_WIDTH for i in range(-1, GRID_WIDTH + 1))
+_WRAP_Y = tuple(
+    (i % GRID_HEIGHT) * GRID_WIDTH for i in range(-1, GRID_HEIGHT + 1)
+)
+
 # Направления движения змейки (dx, dy) в клетках
 UP = (0, -1)
 DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# Сколько нажатий успевает запомнить змейка до следующего шага
+INPUT_QUEUE_SIZE = 2
+
+# Типы событий, которые обрабатывает игра
+_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN)
+
+# Клавиши управления -> направление движения
+_KEY_TO_DIR = {
+    pygame.K_UP: UP,
+    pygame.K_w: UP,
+    pygame.K_DOWN: DOWN,
+    pygame.K_s: DOWN,
+    pygame.K_LEFT: LEFT,
+    pygame.K_a: LEFT,
+    pygame.K_RIGHT: RIGHT,
+    pygame.K_d: RIGHT,
+}
+
 # Цвета (RGB)
 BOARD_BACKGROUND_COLOR = (0, 0, 0)        # фон поля — чёрный
 BORDER_COLOR = (93, 216, 228)             # цвет линий сетки
 APPLE_COLOR = (255, 0, 0)                 # красный цвет яблока
 SNAKE_COLOR = (0, 255, 0)                 # зелёный цвет змейки
 
-# Скорость игры (кол-во шагов/кадров в секунду)
+# Скорость игры (кол-во шагов змейки в секунду)
 SPEED = 20
 
+# Частота кадров: ввод и отрисовка идут чаще, чем шаги змейки
+FPS = 60
+
+# Последние миллисекунды кадра дожидаемся активным ожиданием.
+# Сон pygame.time.wait (SDL_Delay) точен примерно до 1 мс: SDL 2
+# сам включает 1-мс разрешение таймера и на Windows. Запаса в 2 мс
+# хватает, чтобы сон не проскочил конец кадра.
+BUSY_WAIT_MS = 2
+
 
 class GameObject:
     """
@@ -52,8 +98,9 @@ class GameObject:
     Атрибуты
     --------
     position : Tuple[int, int]
-        Текущая позиция объекта на поле, в пикселях. Это координаты
-        левого верхнего угла клетки.
+        Текущая позиция объекта на поле, в клетках сетки
+        (номер столбца и номер строки). В пиксели она переводится
+        только при отрисовке.
     body_color : Tuple[int, int, int]
         Цвет отрисовки объекта в формате RGB.
     """
@@ -69,18 +116,31 @@ class GameObject:
         Parameters
         ----------
         position : Tuple[int, int]
-            Начальные координаты объекта (x, y) в пикселях.
+            Начальные координаты объекта (x, y) в клетках сетки.
         body_color : Tuple[int, int, int]
             Цвет объекта.
         """
         self.position = position
         self.body_color = body_color
 
-    def draw(self, surface: pygame.Surface) -> None:
+        # готовая картинка одной клетки цвета body_color; создаётся
+        # при первой отрисовке, потому что convert() требует окна
+        self._surf: Optional[pygame.Surface] = None
+
+    def _get_surface(self) -> pygame.Surface:
+        """Возвращает залитую цветом объекта картинку клетки."""
+        if self._surf is None:
+            self._surf = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+            self._surf.fill(self.body_color)
+        return self._surf
+
+    def draw(self, surface: pygame.Surface):
         """
         Отрисовывает объект.
 
         Должна быть переопределена в дочернем классе.
+        Возвращает прямоугольник(и) экрана, которые изменились,
+        чтобы обновить только их.
         """
         raise NotImplementedError(
             "Метод draw() должен быть реализован в наследнике."
@@ -93,195 +153,354 @@ class Apple(GameObject):
 
     Яблоко — это квадрат размером в одну клетку GRID_SIZE x GRID_SIZE.
     После съедения змейкой яблоко появляется в новой случайной клетке.
+
+    Атрибуты
+    --------
+    needs_redraw : bool
+        Нужно ли нарисовать яблоко заново: оно ещё не рисовалось,
+        переместилось или было стёрто полной перерисовкой поля.
     """
 
     def __init__(self) -> None:
         """Создаёт яблоко со случайной позицией."""
         super().__init__(position=(0, 0), body_color=APPLE_COLOR)
+        # один прямоугольник на всё время жизни яблока
+        self._rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
+        self.needs_redraw: bool = True
         self.randomize_position()
 
-    def randomize_position(self) -> None:
-        """Устанавливает яблоко в случайную клетку поля."""
-        grid_x = randint(0, GRID_WIDTH - 1)
-        grid_y = randint(0, GRID_HEIGHT - 1)
-        self.position = (grid_x * GRID_SIZE, grid_y * GRID_SIZE)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        """Рисует яблоко как красный квадрат."""
-        rect = pygame.Rect(
-            self.position[0],
-            self.position[1],
-            GRID_SIZE,
-            GRID_SIZE,
-        )
-        pygame.draw.rect(surface, self.body_color, rect)
+    def randomize_position(
+        self,
+        occupied: Optional[Set[Tuple[int, int]]] = None,
+    ) -> bool:
+        """
+        Устанавливает яблоко в случайную свободную клетку поля.
+
+        Parameters
+        ----------
+        occupied : Optional[Set[Tuple[int, int]]]
+            Клетки, занятые змейкой. Яблоко в них не появится.
+
+        Returns
+        -------
+        bool
+            False, если свободных клеток нет (змейка заняла всё
+            поле); позиция яблока тогда не меняется.
+
+        Пока поле занято меньше чем наполовину, просто бросаем
+        случайную клетку до первой свободной. Иначе выбираем
+        сразу из списка свободных клеток, чтобы не крутить
+        цикл почти впустую.
+        """
+        if not occupied:
+            occupied = set()
+
+        if len(occupied) < GRID_WIDTH * GRID_HEIGHT // 2:
+            while True:
+                position = choice(ALL_CELLS)
+                if position not in occupied:
+                    break
+        else:
+            free = [cell for cell in ALL_CELLS if cell not in occupied]
+            if not free:
+                return False
+            position = choice(free)
+
+        if position != self.position:
+            self.position = position
+            self.needs_redraw = True
+        return True
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        Рисует яблоко как красный квадрат и снимает needs_redraw.
+
+        Возвращает прямоугольник клетки яблока.
+        """
+        self.needs_redraw = False
+        grid_x, grid_y = self.position
+        rect = self._rect
+        rect.topleft = (grid_x * GRID_SIZE, grid_y * GRID_SIZE)
+        surface.blit(self._get_surface(), rect)
+        return rect
 
 
 class Snake(GameObject):
     """
     Класс змейки.
 
-    Змейка хранится как список координат сегментов (в пикселях).
-    Первый элемент списка — это голова.
+    Змейка хранится как очередь (deque) координат сегментов
+    (в клетках сетки). Первый элемент очереди — это голова.
 
     Атрибуты
     --------
     length : int
         Текущая длина змейки.
-    positions : List[Tuple[int, int]]
-        Список координат сегментов змейки.
+    positions : Deque[Tuple[int, int]]
+        Очередь координат сегментов змейки.
         Голова = positions[0].
+    body_set : Set[Tuple[int, int]]
+        Множество занятых змейкой клеток — для проверки
+        «занята ли клетка» за O(1).
+    collided : bool
+        Врезалась ли змейка в себя на последнем шаге.
     direction : Tuple[int, int]
         Текущее направление движения (dx, dy).
-    next_direction : Optional[Tuple[int, int]]
-        Направление, выбранное игроком. Оно применится
-        на следующем шаге.
+    input_queue : Deque[Tuple[int, int]]
+        Направления, выбранные игроком, в порядке нажатия.
+        На каждом шаге применяется одно из них, остальные ждут
+        следующих шагов, поэтому быстрые повороты не теряются.
+        Пополняется через queue_direction().
+    last : Optional[Tuple[int, int]]
+        Клетка, которую хвост освободил на последнем шаге
+        (None, если змейка выросла). Её нужно стереть на экране.
+    redraw_all : bool
+        Нужно ли перерисовать всё поле целиком (первый кадр
+        и кадр после сброса).
     """
 
     def __init__(self) -> None:
         """Создаёт змейку в центре экрана."""
-        start_x = (SCREEN_WIDTH // 2 // GRID_SIZE) * GRID_SIZE
-        start_y = (SCREEN_HEIGHT // 2 // GRID_SIZE) * GRID_SIZE
+        start_x = GRID_WIDTH // 2
+        start_y = GRID_HEIGHT // 2
+        start = ALL_CELLS[start_y * GRID_WIDTH + start_x]
 
-        super().__init__(position=(start_x, start_y), body_color=SNAKE_COLOR)
+        super().__init__(position=start, body_color=SNAKE_COLOR)
 
         self.length: int = 1
-        self.positions: List[Tuple[int, int]] = [self.position]
+        self.positions: Deque[Tuple[int, int]] = deque([self.position])
+        self.body_set: Set[Tuple[int, int]] = {self.position}
+        self.collided: bool = False
         self.direction: Tuple[int, int] = RIGHT
-        self.next_direction: Optional[Tuple[int, int]] = None
+        self.input_queue: Deque[Tuple[int, int]] = deque()
+        self.last: Optional[Tuple[int, int]] = None
+        self.redraw_all: bool = True
+
+        # прямоугольники клеток переиспользуются между кадрами
+        self._rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
+        self._tail_rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
 
     def get_head_position(self) -> Tuple[int, int]:
         """Возвращает координаты головы змейки."""
         return self.positions[0]
 
-    def update_direction(self) -> None:
+    def queue_direction(self, direction: Tuple[int, int]) -> None:
         """
-        Применяет направление, запрошенное игроком
-        (next_direction), если это не разворот на 180 градусов.
+        Запоминает направление, выбранное игроком.
+
+        Нажатие сравнивается с последним запомненным направлением
+        (или с текущим, если очередь пуста). Повтор и разворот
+        на 180 градусов отбрасываются сразу, как и нажатия сверх
+        INPUT_QUEUE_SIZE: в очередь попадают только повороты,
+        которые точно будут применены.
         """
-        if self.next_direction is None:
+        queue = self.input_queue
+        if len(queue) >= INPUT_QUEUE_SIZE:
             return
 
-        new_dx, new_dy = self.next_direction
-        cur_dx, cur_dy = self.direction
-
-        # нельзя мгновенно развернуться назад в саму себя
-        if (new_dx, new_dy) == (-cur_dx, -cur_dy):
-            self.next_direction = None
+        prev_dx, prev_dy = queue[-1] if queue else self.direction
+        if direction in ((prev_dx, prev_dy), (-prev_dx, -prev_dy)):
             return
+        queue.append(direction)
 
-        self.direction = (new_dx, new_dy)
-        self.next_direction = None
+    def update_direction(self) -> None:
+        """
+        Применяет первое направление из input_queue.
+
+        Развороты и повторы отсеяны ещё в queue_direction(),
+        поэтому за шаг берётся ровно один поворот, а остальные
+        ждут следующих шагов.
+        """
+        if self.input_queue:
+            self.direction = self.input_queue.popleft()
 
     def move(self) -> None:
         """
         Двигает змейку на одну клетку вперёд.
 
         Логика:
-        1. вычисляем новую позицию головы
-        2. делаем "телепорт через край"
-        3. добавляем голову в начало списка
-        4. если не выросли — обрезаем хвост
+        1. вычисляем новую позицию головы; "телепорт через край"
+           берём из таблиц _WRAP_X и _WRAP_Y
+        2. добавляем голову в начало очереди
+        3. если не выросли — обрезаем хвост
+           и запоминаем его в last
+        4. если голова легла на тело — ставим collided
         """
         head_x, head_y = self.get_head_position()
         dx, dy = self.direction
 
-        new_x = head_x + dx * GRID_SIZE
-        new_y = head_y + dy * GRID_SIZE
-
         # выход за поле -> появление с другой стороны
-        if new_x < 0:
-            new_x = SCREEN_WIDTH - GRID_SIZE
-        elif new_x >= SCREEN_WIDTH:
-            new_x = 0
-
-        if new_y < 0:
-            new_y = SCREEN_HEIGHT - GRID_SIZE
-        elif new_y >= SCREEN_HEIGHT:
-            new_y = 0
-
-        new_head = (new_x, new_y)
+        new_head = ALL_CELLS[
+            _WRAP_Y[head_y + dy + 1] + _WRAP_X[head_x + dx + 1]
+        ]
 
         # добавляем новую голову
-        self.positions.insert(0, new_head)
+        self.positions.appendleft(new_head)
 
         # если не выросли - обрезаем хвост
         if len(self.positions) > self.length:
-            self.positions.pop()
+            self.last = self.positions.pop()
+            self.body_set.discard(self.last)
+        else:
+            self.last = None
+
+        # хвост уже убран, поэтому в освободившуюся клетку
+        # можно зайти без столкновения
+        self.collided = new_head in self.body_set
+        self.body_set.add(new_head)
 
     def draw(
         self,
         surface: pygame.Surface,
         background_surface: pygame.Surface,
-    ) -> None:
+    ) -> List[pygame.Rect]:
         """
-        Рисует фон, потом змейку, потом сетку.
+        Перерисовывает только изменившиеся клетки змейки.
 
-        1. Сначала заливаем фон background_surface,
-           чтобы стереть след.
-        2. Потом рисуем каждый сегмент змейки.
-        3. Потом рисуем линии сетки (для красоты).
+        1. Стираем клетку, которую освободил хвост (last):
+           копируем с background_surface только её участок,
+           вместе с нужным кусочком сетки. Фон целиком
+           на экран не копируется.
+        2. Рисуем новую голову.
+
+        Только если нужно перерисовать всё (redraw_all), заливаем
+        фон целиком и рисуем все сегменты.
+
+        Возвращает список прямоугольников экрана, которые
+        надо передать в pygame.display.update(). Это копии
+        внутренних прямоугольников, поэтому списки нескольких
+        шагов за один кадр можно спокойно объединять.
         """
-        # фон
-        surface.blit(background_surface, (0, 0))
-
-        # тело змейки
-        for segment in self.positions:
-            rect = pygame.Rect(
-                segment[0],
-                segment[1],
-                GRID_SIZE,
-                GRID_SIZE,
-            )
-            pygame.draw.rect(surface, self.body_color, rect)
-
-        # сетка
-        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-            pygame.draw.line(
-                surface,
-                BORDER_COLOR,
-                (x, 0),
-                (x, SCREEN_HEIGHT),
-            )
-        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-            pygame.draw.line(
-                surface,
-                BORDER_COLOR,
-                (0, y),
-                (SCREEN_WIDTH, y),
-            )
+        segment_surf = self._get_surface()
+
+        if self.redraw_all:
+            self.redraw_all = False
+            self.last = None
+
+            # фон
+            surface.blit(background_surface, (0, 0))
+
+            # тело змейки
+            for grid_x, grid_y in self.positions:
+                surface.blit(
+                    segment_surf,
+                    (grid_x * GRID_SIZE, grid_y * GRID_SIZE),
+                )
+            return [surface.get_rect()]
+
+        dirty_rects = []
+
+        # стираем след хвоста
+        if self.last is not None:
+            tail_x, tail_y = self.last
+            tail_rect = self._tail_rect
+            tail_rect.topleft = (tail_x * GRID_SIZE, tail_y * GRID_SIZE)
+            surface.blit(background_surface, tail_rect, tail_rect)
+            dirty_rects.append(tail_rect.copy())
+            self.last = None
+
+        # новая голова
+        head_x, head_y = self.get_head_position()
+        head_rect = self._rect
+        head_rect.topleft = (head_x * GRID_SIZE, head_y * GRID_SIZE)
+        surface.blit(segment_surf, head_rect)
+        dirty_rects.append(head_rect.copy())
+
+        return dirty_rects
 
     def reset(self) -> None:
         """Сбрасывает змейку после самоудара."""
-        start_x = (SCREEN_WIDTH // 2 // GRID_SIZE) * GRID_SIZE
-        start_y = (SCREEN_HEIGHT // 2 // GRID_SIZE) * GRID_SIZE
+        start_x = GRID_WIDTH // 2
+        start_y = GRID_HEIGHT // 2
+        start = ALL_CELLS[start_y * GRID_WIDTH + start_x]
 
         self.length = 1
-        self.positions = [(start_x, start_y)]
+        self.positions = deque([start])
+        self.body_set = {start}
+        self.collided = False
         self.direction = RIGHT
-        self.next_direction = None
+        self.input_queue.clear()
+        self.last = None
+        self.redraw_all = True
 
 
-def handle_keys(snake: Snake) -> None:
+def handle_keys(
+    snake: Snake,
+    event_get=pygame.event.get,
+    key_to_dir_get=_KEY_TO_DIR.get,
+) -> None:
     """
     Обрабатывает события:
     - закрытие окна;
     - нажатия клавиш для смены направления.
+
+    Забираем из очереди только эти два типа событий, остальные
+    не превращаются в объекты Python.
+
+    Функции pygame приходят параметрами по умолчанию: они
+    связываются один раз при объявлении, и в каждом кадре
+    не ищутся заново по атрибутам модуля.
     """
-    for event in pygame.event.get():
+    for event in event_get(_EVENT_TYPES):
         if event.type == pygame.QUIT:
             pygame.quit()
             raise SystemExit
 
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
-                snake.next_direction = UP
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                snake.next_direction = DOWN
-            elif event.key in (pygame.K_LEFT, pygame.K_a):
-                snake.next_direction = LEFT
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                snake.next_direction = RIGHT
+        direction = key_to_dir_get(event.key)
+        if direction is not None:
+            snake.queue_direction(direction)
+
+
+def step_headless(snake: Snake, apple: Apple) -> None:
+    """
+    Делает один шаг игровой логики без обращения к pygame.
+
+    Применяет направление, двигает змейку, проверяет яблоко
+    и самопересечение. Если змейка заняла всё поле и яблоку
+    негде появиться — это победа, игра начинается заново.
+
+    Ничего не рисует и не читает события, поэтому подходит
+    и для игры без окна (прогон записанных партий, обучение бота).
+    """
+    # применить новое направление
+    snake.update_direction()
+
+    # сдвинуть змейку
+    snake.move()
+
+    # проверить яблоко; нет места для нового — победа
+    if snake.get_head_position() == apple.position:
+        snake.length += 1
+        if not apple.randomize_position(snake.body_set):
+            snake.reset()
+            apple.randomize_position(snake.body_set)
+
+    # проверить самопересечение
+    if snake.collided:
+        snake.reset()
+        apple.randomize_position(snake.body_set)
+
+
+def tick_frame(clock: pygame.time.Clock, frame_start: int) -> int:
+    """
+    Дожидается конца кадра без vsync и возвращает его длину в мс.
+
+    Большую часть оставшегося времени спим, не нагружая процессор,
+    и лишь последние BUSY_WAIT_MS мс крутимся в tick_busy_loop,
+    который точнее обычного tick.
+
+    Parameters
+    ----------
+    clock : pygame.time.Clock
+        Часы игрового цикла.
+    frame_start : int
+        pygame.time.get_ticks() в момент начала кадра.
+    """
+    elapsed = pygame.time.get_ticks() - frame_start
+    remaining = 1000 // FPS - elapsed
+    if remaining > BUSY_WAIT_MS:
+        pygame.time.wait(remaining - BUSY_WAIT_MS)
+    return clock.tick_busy_loop(FPS)
 
 
 def main() -> None:
@@ -293,54 +512,118 @@ def main() -> None:
     """
     pygame.init()
 
-    screen = pygame.display.set_mode(
-        (SCREEN_WIDTH, SCREEN_HEIGHT),
-        0,
-        32,
-    )
+    # окно с масштабированием на видеокарте и вертикальной
+    # синхронизацией: кадры выводятся в такт монитору.
+    # Цена SCALED: вывод идёт через SDL renderer, и
+    # display.update(rects) всё равно отправляет на экран весь кадр.
+    # Грязные прямоугольники экономят только нашу отрисовку в памяти
+    # (стираем и рисуем по клетке), но не передачу кадра на экран.
+    # DOUBLEBUF в pygame 2 без OPENGL ничего не делает и не нужен.
+    flags = pygame.SCALED
+    try:
+        screen = pygame.display.set_mode(
+            (SCREEN_WIDTH, SCREEN_HEIGHT),
+            flags,
+            vsync=1,
+        )
+        vsync = True
+    except pygame.error:
+        # драйвер может отказать в vsync — тогда работаем без неё
+        screen = pygame.display.set_mode(
+            (SCREEN_WIDTH, SCREEN_HEIGHT),
+            flags,
+        )
+        vsync = False
     pygame.display.set_caption("Изгиб Питона")
 
+    # остальные события (движение мыши и т.п.) не нужны: не пускаем
+    # их в очередь, чтобы они там не копились
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(_EVENT_TYPES)
+
     clock = pygame.time.Clock()
 
     # фон экрана (однотонная поверхность)
-    background = pygame.Surface(screen.get_size()).convert()
+    background = pygame.Surface(screen.get_size())
     background.fill(BOARD_BACKGROUND_COLOR)
 
+    # сетку рисуем один раз прямо на фоне,
+    # дальше она попадает на экран вместе с ним
+    for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+        pygame.draw.line(
+            background,
+            BORDER_COLOR,
+            (x, 0),
+            (x, SCREEN_HEIGHT),
+        )
+    for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
+        pygame.draw.line(
+            background,
+            BORDER_COLOR,
+            (0, y),
+            (SCREEN_WIDTH, y),
+        )
+    background = background.convert()
+
     # игровые объекты
     snake = Snake()
     apple = Apple()
-
-    # игровой цикл
+    apple.randomize_position(snake.body_set)
+
+    # время одного шага змейки и накопленное, но ещё
+    # не отработанное время (в секундах)
+    step_time = 1 / SPEED
+    accumulator = 0.0
+
+    # часто вызываемые функции — в локальные переменные,
+    # чтобы цикл не искал их каждый кадр по атрибутам
+    display_update = pygame.display.update
+    get_ticks = pygame.time.get_ticks
+    snake_draw = snake.draw
+    apple_draw = apple.draw
+
+    # первый кадр: фон с сеткой, змейка целиком и яблоко
+    dirty_rects = snake_draw(screen, background)
+    dirty_rects.append(apple_draw(screen))
+    frame_start = get_ticks()
+
+    # игровой цикл: кадры идут с частотой FPS,
+    # а змейка шагает с частотой SPEED
     while True:
-        # обработать ввод пользователя
+        # обработать ввод пользователя (каждый кадр)
         handle_keys(snake)
 
-        # применить новое направление
-        snake.update_direction()
-
-        # сдвинуть змейку
-        snake.move()
-
-        # проверить яблоко
-        if snake.get_head_position() == apple.position:
-            snake.length += 1
-            apple.randomize_position()
-
-        # проверить самопересечение
-        head = snake.get_head_position()
-        if head in snake.positions[1:]:
-            snake.reset()
-            apple.randomize_position()
-
-        # нарисовать фон + змейку + яблоко
-        snake.draw(screen, background)
-        apple.draw(screen)
-
-        # обновить экран
-        pygame.display.update()
-
-        # ограничить скорость игры
-        clock.tick(SPEED)
+        # отработать все шаги змейки, на которые накопилось время
+        while accumulator >= step_time:
+            accumulator -= step_time
+            step_headless(snake, apple)
+
+            # перерисовать изменившиеся клетки змейки; полная
+            # перерисовка после сброса стирает и яблоко
+            if snake.redraw_all:
+                apple.needs_redraw = True
+            dirty_rects.extend(snake_draw(screen, background))
+
+        # яблоко рисуем, только если оно переместилось или стёрто
+        if apple.needs_redraw:
+            dirty_rects.append(apple_draw(screen))
+
+        # обновить на экране только изменившиеся участки
+        display_update(dirty_rects)
+        dirty_rects = []
+
+        # ограничить частоту кадров. С vsync темп задаёт сам вывод
+        # кадра, и хватает обычного tick; без неё спим почти до конца
+        # кадра и точно доводим его в tick_busy_loop (см. tick_frame).
+        if vsync:
+            frame_time = clock.tick(FPS)
+        else:
+            frame_time = tick_frame(clock, frame_start)
+        frame_start = get_ticks()
+
+        # Долгую паузу (например, перетаскивание окна) не
+        # отрабатываем пачкой шагов, а обрезаем до четверти секунды.
+        accumulator += min(frame_time / 1000, 0.25)
 
 
 if __name__ == "__main__":